@@ -1,92 +1,245 @@
 import pygame
 import math
-from abc import ABC, abstractmethod
+from entity_pool import get_shared_pool
+
+# Precomputed sin/cos lookup tables for integer degrees. Rotations are kept
+# in 0-360 and quantized, so trig on the hot path becomes a tuple index.
+_SIN360 = tuple(math.sin(math.radians(d)) for d in range(360))
+_COS360 = tuple(math.cos(math.radians(d)) for d in range(360))
 
 class Transform:
-    """Component that handles position and rotation"""
-    def __init__(self, x=0, y=0, rotation=0):
-        self.x = x
-        self.y = y
-        self.rotation = rotation
-    
+    """Component that handles position and rotation (backed by the shared EntityPool)"""
+    __slots__ = ('pool', 'id')
+
+    def __init__(self, pool, entity_id, x=0, y=0, rotation=0):
+        self.pool = pool
+        self.id = entity_id
+        pool.pos_x[entity_id] = x
+        pool.pos_y[entity_id] = y
+        pool.rot[entity_id] = rotation
+
+    @property
+    def x(self):
+        return self.pool.pos_x[self.id]
+
+    @x.setter
+    def x(self, value):
+        self.pool.pos_x[self.id] = value
+
+    @property
+    def y(self):
+        return self.pool.pos_y[self.id]
+
+    @y.setter
+    def y(self, value):
+        self.pool.pos_y[self.id] = value
+
+    @property
+    def rotation(self):
+        return self.pool.rot[self.id]
+
+    @rotation.setter
+    def rotation(self, value):
+        self.pool.rot[self.id] = value
+
     def set_position(self, x, y):
         """Set the position"""
-        self.x = x
-        self.y = y
-    
+        self.pool.pos_x[self.id] = x
+        self.pool.pos_y[self.id] = y
+
     def get_position(self):
         """Get the position as a tuple"""
-        return (self.x, self.y)
-    
+        return self.pool.get_position(self.id)
+
     def set_rotation(self, rotation):
-        """Set the rotation, keeping it within 0-360 degrees"""
-        self.rotation = rotation % 360
-    
+        """Set the rotation, keeping it within 0-360 degrees.
+
+        Returns True if the rotation actually changed, so callers can skip
+        downstream work (sprite re-rotation) on no-op sets.
+        """
+        new_rotation = rotation % 360
+        if new_rotation == self.pool.rot[self.id]:
+            return False
+        self.pool.rot[self.id] = new_rotation
+        return True
+
     def rotate(self, delta_rotation):
         """Add to the current rotation"""
-        self.rotation = (self.rotation + delta_rotation) % 360
+        self.pool.rot[self.id] = (self.pool.rot[self.id] + delta_rotation) % 360
+
+    def sin_cos(self):
+        """Get (sin, cos) of the rotation from the degree lookup tables"""
+        degrees = int(self.pool.rot[self.id]) % 360
+        return (_SIN360[degrees], _COS360[degrees])
 
 class Physics:
-    """Component that handles velocity and physics calculations"""
-    def __init__(self, velocity_x=0, velocity_y=0, max_velocity=15, min_velocity=-15):
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.max_velocity = max_velocity
-        self.min_velocity = min_velocity
-        
-        # Store previous position for collision rollback
-        self.prev_x = 0
-        self.prev_y = 0
-    
+    """Component that handles velocity and physics calculations (backed by the shared EntityPool)"""
+    __slots__ = ('pool', 'id')
+
+    def __init__(self, pool, entity_id, velocity_x=0, velocity_y=0, max_velocity=15, min_velocity=-15):
+        self.pool = pool
+        self.id = entity_id
+        pool.vx[entity_id] = velocity_x
+        pool.vy[entity_id] = velocity_y
+        pool.max_v[entity_id] = max_velocity
+        pool.min_v[entity_id] = min_velocity
+
+        # Previous position for collision rollback starts at the origin
+        pool.prev_x[entity_id] = 0
+        pool.prev_y[entity_id] = 0
+
+    @property
+    def velocity_x(self):
+        return self.pool.vx[self.id]
+
+    @velocity_x.setter
+    def velocity_x(self, value):
+        self.pool.vx[self.id] = value
+
+    @property
+    def velocity_y(self):
+        return self.pool.vy[self.id]
+
+    @velocity_y.setter
+    def velocity_y(self, value):
+        self.pool.vy[self.id] = value
+
+    @property
+    def max_velocity(self):
+        return self.pool.max_v[self.id]
+
+    @max_velocity.setter
+    def max_velocity(self, value):
+        self.pool.max_v[self.id] = value
+
+    @property
+    def min_velocity(self):
+        return self.pool.min_v[self.id]
+
+    @min_velocity.setter
+    def min_velocity(self, value):
+        self.pool.min_v[self.id] = value
+
+    @property
+    def prev_x(self):
+        return self.pool.prev_x[self.id]
+
+    @prev_x.setter
+    def prev_x(self, value):
+        self.pool.prev_x[self.id] = value
+
+    @property
+    def prev_y(self):
+        return self.pool.prev_y[self.id]
+
+    @prev_y.setter
+    def prev_y(self, value):
+        self.pool.prev_y[self.id] = value
+
     def set_velocity(self, velocity_x, velocity_y):
         """Set the velocity components"""
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-    
+        self.pool.vx[self.id] = velocity_x
+        self.pool.vy[self.id] = velocity_y
+
     def add_velocity(self, delta_x, delta_y):
         """Add to the current velocity"""
-        self.velocity_x += delta_x
-        self.velocity_y += delta_y
-    
+        self.pool.vx[self.id] += delta_x
+        self.pool.vy[self.id] += delta_y
+
     def apply_gravity(self, gravity):
         """Apply gravity to the velocity"""
-        self.velocity_y += gravity
-    
+        self.pool.vy[self.id] += gravity
+
     def clamp_velocity(self):
         """Clamp velocity to min/max bounds"""
-        self.velocity_x = max(self.min_velocity, min(self.max_velocity, self.velocity_x))
-        self.velocity_y = max(self.min_velocity, min(self.max_velocity, self.velocity_y))
-    
+        pool, i = self.pool, self.id
+        pool.vx[i] = max(pool.min_v[i], min(pool.max_v[i], pool.vx[i]))
+        pool.vy[i] = max(pool.min_v[i], min(pool.max_v[i], pool.vy[i]))
+
     def store_previous_position(self, x, y):
         """Store the previous position for collision rollback"""
-        self.prev_x = x
-        self.prev_y = y
-    
+        self.pool.prev_x[self.id] = x
+        self.pool.prev_y[self.id] = y
+
     def get_previous_position(self):
         """Get the previous position"""
-        return (self.prev_x, self.prev_y)
+        return (self.pool.prev_x[self.id], self.pool.prev_y[self.id])
 
 class Renderer:
     """Component that handles image rendering and rotation"""
+    __slots__ = ('original_image', 'current_image', 'rect', '_rotation_cache',
+                 '_offset_cache', 'current_offset', '_size', '_half_w', '_half_h')
+
     def __init__(self, image_path=None):
         self.original_image = None
         self.current_image = None
         self.rect = None
-        
+
+        # Cache of pre-rotated surfaces keyed by integer degree, so repeated
+        # rotations index a table instead of re-rotating every frame
+        self._rotation_cache = {}
+
+        # Per-angle (dx, dy) from entity position to the rotated image's
+        # top-left, cached alongside the surfaces; current_offset always
+        # matches current_image
+        self._offset_cache = {}
+        self.current_offset = (0, 0)
+
+        # Cached dimensions of the original image (set by load_image)
+        self._size = (0, 0)
+        self._half_w = 0
+        self._half_h = 0
+
         if image_path:
             self.load_image(image_path)
-    
+
     def load_image(self, image_path):
-        """Load an image from file"""
-        self.original_image = pygame.image.load(image_path)
+        """Load an image from file, converting to display format so blits
+        (and the rotated copies derived from it) skip per-pixel format
+        conversion"""
+        self.original_image = pygame.image.load(image_path).convert_alpha()
         self.current_image = self.original_image.copy()
         self.rect = self.current_image.get_rect()
-    
+        self._rotation_cache = {}
+        self._offset_cache = {}
+        self.current_offset = (0, 0)
+
+        # Cache dimensions used by positioning, bounds and collision
+        # arithmetic; the original surface never changes size
+        self._size = self.original_image.get_size()
+        width, height = self._size
+        self._half_w = width // 2
+        self._half_h = height // 2
+
+    def prewarm_rotations(self, step):
+        """Pre-rotate the original image for every angle reachable in
+        multiples of step degrees, so gameplay never pays for a first-use
+        rotation"""
+        if not self.original_image:
+            return
+        for angle in range(0, 360, step):
+            if angle not in self._rotation_cache:
+                self._rotation_cache[angle] = pygame.transform.rotate(self.original_image, -angle)
+
     def update_rotation(self, rotation):
         """Update the rendered image based on rotation"""
         if self.original_image:
-            # Rotate the image (negative rotation for pygame coordinate system)
-            self.current_image = pygame.transform.rotate(self.original_image, -rotation)
+            # Look up the rotated surface in the cache, rotating once per
+            # distinct integer degree (negative rotation for pygame coords)
+            key = round(rotation) % 360
+            rotated = self._rotation_cache.get(key)
+            if rotated is None:
+                rotated = pygame.transform.rotate(self.original_image, -key)
+                self._rotation_cache[key] = rotated
+            self.current_image = rotated
+
+            # Keep the collision offset for this angle in step with the image
+            offset = self._offset_cache.get(key)
+            if offset is None:
+                offset = (self._half_w - rotated.get_width() // 2,
+                          self._half_h - rotated.get_height() // 2)
+                self._offset_cache[key] = offset
+            self.current_offset = offset
             # Update rect but preserve center position
             old_center = self.rect.center if self.rect else (0, 0)
             self.rect = self.current_image.get_rect()
@@ -96,8 +249,12 @@ class Renderer:
         """Update the renderer position"""
         if self.rect and self.original_image:
             # Center the rotated image on the entity position
-            self.rect.centerx = x + self.original_image.get_width() // 2
-            self.rect.centery = y + self.original_image.get_height() // 2
+            self.rect.centerx = x + self._half_w
+            self.rect.centery = y + self._half_h
+
+    def get_half_size(self):
+        """Get the cached half-dimensions of the original image"""
+        return (self._half_w, self._half_h)
     
     def get_image(self):
         """Get the current rendered image"""
@@ -108,16 +265,21 @@ class Renderer:
         return self.rect
     
     def get_original_size(self):
-        """Get the original image size"""
-        if self.original_image:
-            return self.original_image.get_size()
-        return (0, 0)
+        """Get the original image size (cached at load)"""
+        return self._size
 
-class Entity(ABC):
+class Entity:
     """Base class for all game entities"""
+    __slots__ = ('pool', 'id', 'transform', 'physics', 'renderer', 'is_static')
     def __init__(self, x=0, y=0, rotation=0, image_path=None):
-        self.transform = Transform(x, y, rotation)
-        self.physics = Physics()
+        self.pool = get_shared_pool()
+        self.id = self.pool.allocate()
+
+        # Static entities (e.g. the ghost) are driven externally and skip
+        # physics integration entirely
+        self.is_static = False
+        self.transform = Transform(self.pool, self.id, x, y, rotation)
+        self.physics = Physics(self.pool, self.id)
         self.renderer = Renderer(image_path)
         
         # Initialize renderer position
@@ -130,6 +292,9 @@ class Entity(ABC):
     
     def set_position(self, x, y):
         """Set the entity position"""
+        # Skip the transform write and renderer rect update when unchanged
+        if x == self.transform.x and y == self.transform.y:
+            return
         self.transform.set_position(x, y)
         self.renderer.update_position(x, y)
     
@@ -139,8 +304,9 @@ class Entity(ABC):
     
     def set_rotation(self, rotation):
         """Set the entity rotation"""
-        self.transform.set_rotation(rotation)
-        self.renderer.update_rotation(self.transform.rotation)
+        # Only re-rotate the sprite when the rotation actually changed
+        if self.transform.set_rotation(rotation):
+            self.renderer.update_rotation(self.transform.rotation)
     
     def get_velocity(self):
         """Get the entity velocity"""
@@ -152,15 +318,21 @@ class Entity(ABC):
     
     def update_physics(self, delta_time=1.0):
         """Update entity physics (position based on velocity)"""
+        if self.is_static:
+            return
+        pool, i = self.pool, self.id
+
         # Store previous position for collision rollback
-        self.physics.store_previous_position(self.transform.x, self.transform.y)
-        
+        pool.prev_x[i] = pool.pos_x[i]
+        pool.prev_y[i] = pool.pos_y[i]
+
         # Update position based on velocity
-        self.transform.x += self.physics.velocity_x * delta_time
-        self.transform.y += self.physics.velocity_y * delta_time
-        
-        # Update renderer position
-        self.renderer.update_position(self.transform.x, self.transform.y)
+        pool.pos_x[i] += pool.vx[i] * delta_time
+        pool.pos_y[i] += pool.vy[i] * delta_time
+
+        # Update renderer position only when the entity actually moved
+        if pool.vx[i] != 0 or pool.vy[i] != 0:
+            self.renderer.update_position(pool.pos_x[i], pool.pos_y[i])
     
     def rollback_position(self):
         """Rollback to previous position (for collision handling)"""
@@ -172,7 +344,6 @@ class Entity(ABC):
         if self.renderer.get_image() and self.renderer.get_rect():
             screen.blit(self.renderer.get_image(), self.renderer.get_rect())
     
-    @abstractmethod
     def update(self, delta_time=1.0):
-        """Update the entity (to be implemented by subclasses)"""
+        """Update the entity (overridden by subclasses; no-op by default)"""
         pass
\ No newline at end of file
@@ -0,0 +1,99 @@
+import numpy as np
+
+class EntityPool:
+    """
+    Structure-of-arrays storage for entity transform and physics state.
+
+    Instead of every entity carrying its own Python attributes for position,
+    rotation and velocity, all entities share parallel NumPy arrays and hold
+    just an integer index into them. This keeps the per-frame state in
+    contiguous float64 arrays and allows physics updates to be batched over
+    all entities at once instead of one attribute lookup at a time.
+    """
+
+    DEFAULT_CAPACITY = 8
+    DEFAULT_MAX_VELOCITY = 15
+    DEFAULT_MIN_VELOCITY = -15
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+
+        # Parallel per-entity state arrays (indexed by entity id)
+        self.pos_x = np.zeros(capacity)
+        self.pos_y = np.zeros(capacity)
+        self.rot = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+
+        # Previous position for collision rollback
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+
+        # Per-entity velocity bounds
+        self.min_v = np.full(capacity, float(self.DEFAULT_MIN_VELOCITY))
+        self.max_v = np.full(capacity, float(self.DEFAULT_MAX_VELOCITY))
+
+        # Scratch buffer so step() can integrate without temporaries
+        self._scratch = np.zeros(capacity)
+
+    def allocate(self):
+        """Allocate a slot for a new entity and return its integer id"""
+        if self.count >= self.capacity:
+            self._grow()
+        entity_id = self.count
+        self.count += 1
+        return entity_id
+
+    def _grow(self):
+        """Double the capacity of all state arrays"""
+        new_capacity = self.capacity * 2
+        for name in ('pos_x', 'pos_y', 'rot', 'vx', 'vy', 'prev_x', 'prev_y', '_scratch'):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity)
+            grown[:self.capacity] = old
+            setattr(self, name, grown)
+        for name, fill in (('min_v', self.DEFAULT_MIN_VELOCITY),
+                           ('max_v', self.DEFAULT_MAX_VELOCITY)):
+            old = getattr(self, name)
+            grown = np.full(new_capacity, float(fill))
+            grown[:self.capacity] = old
+            setattr(self, name, grown)
+        self.capacity = new_capacity
+
+    def step(self, delta_time=1.0):
+        """
+        Advance physics for every allocated entity in one vectorized pass.
+
+        Clamps velocities to their per-entity bounds, stores previous
+        positions for collision rollback, then integrates position from
+        velocity. Uses out= arguments to avoid allocating temporaries.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        # Clamp velocity to min/max bounds
+        np.clip(self.vx[:n], self.min_v[:n], self.max_v[:n], out=self.vx[:n])
+        np.clip(self.vy[:n], self.min_v[:n], self.max_v[:n], out=self.vy[:n])
+
+        # Store previous positions for collision rollback
+        self.prev_x[:n] = self.pos_x[:n]
+        self.prev_y[:n] = self.pos_y[:n]
+
+        # Integrate position from velocity
+        np.multiply(self.vx[:n], delta_time, out=self._scratch[:n])
+        np.add(self.pos_x[:n], self._scratch[:n], out=self.pos_x[:n])
+        np.multiply(self.vy[:n], delta_time, out=self._scratch[:n])
+        np.add(self.pos_y[:n], self._scratch[:n], out=self.pos_y[:n])
+
+    def get_position(self, entity_id):
+        """Get the position of an entity as a tuple"""
+        return (self.pos_x[entity_id], self.pos_y[entity_id])
+
+# Shared pool used by all entities created without an explicit pool
+_shared_pool = EntityPool()
+
+def get_shared_pool():
+    """Get the pool shared by all game entities"""
+    return _shared_pool
@@ -14,6 +14,31 @@ class GameRenderer:
         
         # Timer font - preserved from original main.py
         self.timer_font = pygame.font.Font(None, 48)
+
+        # Timer surfaces are cached in two halves: the "MM:SS." prefix only
+        # changes once a second, and the millisecond suffix cycles through a
+        # bounded set of 1000 strings, so after warm-up every frame is two
+        # cache hits instead of a font render
+        self._timer_cache = {}
+        self._timer_cache_limit = 256
+        self._timer_ms_cache = {}
+
+        # Pre-build the level completion overlay and message once; the
+        # per-frame path is then just two blits
+        self._completion_overlay = pygame.Surface((screen_width, screen_height))
+        self._completion_overlay.set_alpha(128)
+        self._completion_overlay.fill(self.BLACK)
+        self._completion_text = self.timer_font.render("Level Complete! Returning to menu...", True, self.WHITE)
+        self._completion_text_rect = self._completion_text.get_rect(
+            center=(screen_width // 2, screen_height // 2)
+        )
+
+        # Dirty-rect tracking: regions drawn this frame, the sprite/HUD rects
+        # from the previous frame (to restore background under them), and a
+        # flag forcing the next gameplay frame to redraw everything
+        self._dirty_rects = []
+        self._prev_frame_rects = []
+        self._full_redraw = True
     
     def clear_screen(self, screen):
         """Clear the screen with black background"""
@@ -25,67 +50,111 @@ class GameRenderer:
             screen.blit(level.get_visual_surface(), (0, 0))
     
     def render_spaceship(self, screen, spaceship):
-        """Render the spaceship"""
+        """Render the spaceship; returns the drawn rect (or None)"""
         if spaceship and spaceship.renderer.get_image() and spaceship.renderer.get_rect():
             screen.blit(spaceship.renderer.get_image(), spaceship.renderer.get_rect())
-    
+            return spaceship.renderer.get_rect()
+        return None
+
     def render_ghost(self, screen, ghost):
-        """Render the ghost spaceship with transparency"""
+        """Render the ghost spaceship with transparency; returns the drawn rect (or None)"""
         if ghost and ghost.is_visible() and ghost.renderer.get_image() and ghost.renderer.get_rect():
             screen.blit(ghost.renderer.get_image(), ghost.renderer.get_rect())
+            return ghost.renderer.get_rect()
+        return None
     
     def render_timer(self, screen, timer_text):
         """Render the timer in top-right corner with black background (matching original)"""
-        # Render timer text
-        timer_surface = self.timer_font.render(timer_text, True, self.WHITE)
-        timer_rect = timer_surface.get_rect()
+        # Split "MM:SS.mmm" into its slowly-changing prefix and cycling
+        # millisecond suffix; each half is rasterized at most once
+        prefix_text = timer_text[:6]
+        suffix_text = timer_text[6:]
+
+        prefix_surface = self._timer_cache.get(prefix_text)
+        if prefix_surface is None:
+            prefix_surface = self.timer_font.render(prefix_text, True, self.WHITE)
+            if len(self._timer_cache) >= self._timer_cache_limit:
+                # Simple FIFO eviction to keep the cache bounded
+                self._timer_cache.pop(next(iter(self._timer_cache)))
+            self._timer_cache[prefix_text] = prefix_surface
+
+        # The suffix domain is bounded (000-999), so no eviction needed
+        suffix_surface = self._timer_ms_cache.get(suffix_text)
+        if suffix_surface is None:
+            suffix_surface = self.timer_font.render(suffix_text, True, self.WHITE)
+            self._timer_ms_cache[suffix_text] = suffix_surface
+
+        timer_rect = pygame.Rect(
+            0, 0,
+            prefix_surface.get_width() + suffix_surface.get_width(),
+            max(prefix_surface.get_height(), suffix_surface.get_height())
+        )
         timer_rect.topright = (self.screen_width - 20, 20)  # 20px padding from edges
-        
+
         # Draw black background rectangle for better text readability (matching original)
         background_padding = 8
         background_rect = timer_rect.copy()
         background_rect.inflate_ip(background_padding * 2, background_padding * 2)
         pygame.draw.rect(screen, self.BLACK, background_rect)
-        
-        # Draw the timer text on top of the black background
-        screen.blit(timer_surface, timer_rect)
+
+        # Draw both halves of the timer text on top of the black background
+        screen.blit(prefix_surface, timer_rect)
+        screen.blit(suffix_surface, (timer_rect.left + prefix_surface.get_width(), timer_rect.top))
+        return background_rect
     
     def render_menu(self, screen, menu_state):
         """Render the menu (delegated to MenuState)"""
         if menu_state:
             menu_state.render(screen)
-    
+        # Menu draws the whole screen, so the next gameplay frame must too
+        self._full_redraw = True
+
     def render_level_completion_overlay(self, screen):
         """Render level completion overlay (matching original)"""
-        # Show completion message
-        completion_text = self.timer_font.render("Level Complete! Returning to menu...", True, self.WHITE)
-        completion_rect = completion_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-        
-        # Draw completion overlay (matching original)
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(128)
-        overlay.fill(self.BLACK)
-        screen.blit(overlay, (0, 0))
-        screen.blit(completion_text, completion_rect)
+        # Blit the pre-built overlay and completion message
+        screen.blit(self._completion_overlay, (0, 0))
+        screen.blit(self._completion_text, self._completion_text_rect)
+        self._full_redraw = True
     
     def render_gameplay_scene(self, screen, level, spaceship, timer_text, ghost=None):
-        """Render the complete gameplay scene"""
-        # Clear screen
-        self.clear_screen(screen)
-        
-        # Render level background
-        self.render_level_background(screen, level)
-        
+        """Render the complete gameplay scene with dirty-rect tracking"""
+        if self._full_redraw:
+            # Full repaint: clear screen and blit the whole level background
+            self.clear_screen(screen)
+            self.render_level_background(screen, level)
+            self._dirty_rects.append(pygame.Rect(0, 0, self.screen_width, self.screen_height))
+            self._full_redraw = False
+        else:
+            # Restore the background only where sprites/HUD were last frame
+            level_surface = level.get_visual_surface() if level else None
+            for rect in self._prev_frame_rects:
+                screen.fill(self.BLACK, rect)
+                if level_surface:
+                    screen.blit(level_surface, rect.topleft, area=rect)
+                self._dirty_rects.append(rect)
+
+        frame_rects = []
+
         # Render ghost first (behind the player spaceship)
         if ghost:
-            self.render_ghost(screen, ghost)
-        
+            frame_rects.append(self.render_ghost(screen, ghost))
+
         # Render spaceship (on top of ghost)
-        self.render_spaceship(screen, spaceship)
-        
+        frame_rects.append(self.render_spaceship(screen, spaceship))
+
         # Render timer
-        self.render_timer(screen, timer_text)
-    
+        frame_rects.append(self.render_timer(screen, timer_text))
+
+        # Remember this frame's rects so the next frame can restore the
+        # background under them; copies, since the renderer rects mutate
+        self._prev_frame_rects = [rect.copy() for rect in frame_rects if rect]
+        self._dirty_rects.extend(self._prev_frame_rects)
+
     def update_display(self):
-        """Update the pygame display"""
-        pygame.display.flip()
\ No newline at end of file
+        """Present the frame, updating only the dirty regions when tracked"""
+        if self._dirty_rects:
+            pygame.display.update(self._dirty_rects)
+            self._dirty_rects.clear()
+        else:
+            # Paths without dirty tracking (menu, completion overlay)
+            pygame.display.flip()
\ No newline at end of file
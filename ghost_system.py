@@ -1,6 +1,37 @@
 import pygame
+import base64
+import zlib
+import numpy as np
+from collections import namedtuple
 from entity import Entity
 
+# Column-oriented view of a recording: one array per field, zero-copy
+# slices of the recorder's backing arrays
+RecordedData = namedtuple('RecordedData', ['timestamp', 'x', 'y', 'rotation'])
+
+
+def _decode_packed_frames(packed):
+    """
+    Decode a packed ghost dict into (ts, x, y, rot) arrays.
+
+    Version 2 stores int16 columns with delta-encoded timestamps; version 1
+    (no version key) stores absolute float32 values. Both are zlib/base64.
+    """
+    raw = zlib.decompress(base64.b64decode(packed['data']))
+    if packed.get('version', 1) >= 2:
+        frames = np.frombuffer(raw, dtype=np.int16).reshape(packed['shape'])
+        ts = np.cumsum(frames[:, 0], dtype=np.int32)
+        x = frames[:, 1].astype(np.float32)
+        y = frames[:, 2].astype(np.float32)
+        rot = frames[:, 3].astype(np.float32)
+    else:
+        frames = np.frombuffer(raw, dtype=np.float32).reshape(packed['shape'])
+        ts = frames[:, 0].astype(np.int32)
+        x = frames[:, 1].copy()
+        y = frames[:, 2].copy()
+        rot = frames[:, 3].copy()
+    return ts, x, y, rot
+
 class GhostFrame:
     """Represents a single frame of ghost data"""
     def __init__(self, timestamp, x, y, rotation):
@@ -11,96 +42,166 @@ class GhostFrame:
 
 class GhostRecorder:
     """Handles recording spaceship state data for ghost playback"""
-    
+
+    # Preallocate five minutes of frames at 60 fps; the arrays double if a
+    # run outlasts them. One array per field: timestamp, x, y, rotation.
+    INITIAL_FRAMES = 60 * 60 * 5
+    FIELDS = 4
+
     def __init__(self):
-        self.frames = []
+        self._ts = np.zeros(self.INITIAL_FRAMES, dtype=np.int32)
+        self._x = np.zeros(self.INITIAL_FRAMES, dtype=np.float32)
+        self._y = np.zeros(self.INITIAL_FRAMES, dtype=np.float32)
+        self._rot = np.zeros(self.INITIAL_FRAMES, dtype=np.float32)
+        self._frame_count = 0
         self.recording = False
         self.start_time = 0
-    
+
+        # Sample at 20 Hz rather than every frame; playback interpolates
+        # between samples, so the ghost stays smooth at a third of the data
+        self.sample_interval_ms = 50
+        self._last_sample_ts = 0
+
+    def _grow(self):
+        """Double the capacity of the recording arrays"""
+        self._ts = np.concatenate((self._ts, np.zeros_like(self._ts)))
+        self._x = np.concatenate((self._x, np.zeros_like(self._x)))
+        self._y = np.concatenate((self._y, np.zeros_like(self._y)))
+        self._rot = np.concatenate((self._rot, np.zeros_like(self._rot)))
+
     def start_recording(self):
         """Start recording ghost data"""
-        self.frames = []
+        self._frame_count = 0
         self.recording = True
         self.start_time = pygame.time.get_ticks()
-    
+        self._last_sample_ts = -self.sample_interval_ms  # record the first frame
+
     def stop_recording(self):
         """Stop recording ghost data"""
         self.recording = False
-    
-    def record_frame(self, spaceship):
-        """Record a frame of spaceship data"""
+
+    def record_frame(self, spaceship, now=None):
+        """Record a frame of spaceship data (now is an optional shared
+        tick reading for this frame)"""
         if not self.recording or not spaceship:
             return
-        
-        current_time = pygame.time.get_ticks()
-        timestamp = current_time - self.start_time
-        
-        # Get spaceship position and rotation
+
+        if now is None:
+            now = pygame.time.get_ticks()
+        timestamp = now - self.start_time
+
+        # Skip frames inside the sampling interval
+        if timestamp - self._last_sample_ts < self.sample_interval_ms:
+            return
+        self._last_sample_ts = timestamp
+
+        # Write into the preallocated arrays, doubling them if the run is
+        # longer than the current capacity
+        n = self._frame_count
+        if n >= len(self._ts):
+            self._grow()
+
         x, y = spaceship.get_position()
-        rotation = spaceship.get_rotation()
-        
-        # Create and store frame data
-        frame = GhostFrame(timestamp, x, y, rotation)
-        self.frames.append(frame)
-    
+        self._ts[n] = timestamp
+        self._x[n] = x
+        self._y[n] = y
+        self._rot[n] = spaceship.get_rotation()
+        self._frame_count = n + 1
+
     def get_recorded_data(self):
-        """Get the recorded frame data"""
-        return self.frames.copy()
-    
+        """
+        Get the recorded frames as a RecordedData namedtuple of array views.
+
+        The views alias the recorder's backing arrays, so no per-frame
+        objects are built; callers needing stable data should copy before
+        the next recording starts.
+        """
+        n = self._frame_count
+        return RecordedData(self._ts[:n], self._x[:n], self._y[:n], self._rot[:n])
+
     def export_recording(self):
         """Export recorded data as a list of dictionaries for saving"""
+        n = self._frame_count
         return [
             {
-                'timestamp': frame.timestamp,
-                'x': int(frame.x),
-                'y': int(frame.y),
-                'rotation': int(frame.rotation)
+                'timestamp': int(t),
+                'x': int(x),
+                'y': int(y),
+                'rotation': int(r)
             }
-            for frame in self.frames
+            for t, x, y, r in zip(self._ts[:n], self._x[:n], self._y[:n], self._rot[:n])
         ]
-    
+
     def import_recording(self, recording_data):
-        """Import recording data from a list of dictionaries"""
-        self.frames = []
-        for frame_dict in recording_data:
-            frame = GhostFrame(
-                frame_dict['timestamp'],
-                frame_dict['x'],
-                frame_dict['y'],
-                frame_dict['rotation']
-            )
-            self.frames.append(frame)
-    
+        """
+        Import recording data from either the compressed dict format
+        produced by export_playback_data or the legacy list of per-frame
+        dictionaries.
+        """
+        if isinstance(recording_data, dict):
+            self._ts, self._x, self._y, self._rot = _decode_packed_frames(recording_data)
+            self._frame_count = len(self._ts)
+            return
+
+        n = len(recording_data)
+        if n > len(self._ts):
+            self._ts = np.zeros(n, dtype=np.int32)
+            self._x = np.zeros(n, dtype=np.float32)
+            self._y = np.zeros(n, dtype=np.float32)
+            self._rot = np.zeros(n, dtype=np.float32)
+        for i, frame_dict in enumerate(recording_data):
+            self._ts[i] = frame_dict['timestamp']
+            self._x[i] = frame_dict['x']
+            self._y[i] = frame_dict['y']
+            self._rot[i] = frame_dict['rotation']
+        self._frame_count = n
+
     def is_recording(self):
         """Check if currently recording"""
         return self.recording
-    
+
     def clear_recording(self):
         """Clear recorded data"""
-        self.frames = []
+        self._frame_count = 0
         self.recording = False
 
     def export_playback_data(self):
-        """Export current playback data as a list of dictionaries"""
-        return [
-            {
-                'timestamp': frame.timestamp,
-                'x': int(frame.x),
-                'y': int(frame.y),
-                'rotation': frame.rotation
-            }
-            for frame in self.frames
-        ]
+        """
+        Export current playback data as zlib-compressed base64 (version 2).
+
+        Timestamps are delta-encoded (frame-to-frame gaps are tiny and very
+        repetitive, so they compress far better than absolute ticks) and all
+        four columns are stored as int16 — positions fit the screen range
+        and rotations are whole degrees. Roughly 10x smaller again than the
+        float32 block, keeping ghost uploads to the API short.
+        """
+        n = self._frame_count
+        frames = np.empty((n, self.FIELDS), dtype=np.int16)
+        frames[:, 0] = np.diff(self._ts[:n], prepend=0)
+        frames[:, 1] = np.rint(self._x[:n])
+        frames[:, 2] = np.rint(self._y[:n])
+        frames[:, 3] = np.rint(self._rot[:n])
+        return {
+            'version': 2,
+            'shape': [int(n), self.FIELDS],
+            'data': base64.b64encode(zlib.compress(frames.tobytes())).decode('ascii')
+        }
 
 class GhostPlayback:
     """Handles playing back recorded ghost data"""
     
     def __init__(self):
-        self.frames = []
+        # SoA playback state: one array per field, GhostFrame views are
+        # built on demand instead of keeping a list of frame objects
+        self._ts = np.zeros(0, dtype=np.int32)
+        self._x = np.zeros(0, dtype=np.float32)
+        self._y = np.zeros(0, dtype=np.float32)
+        self._rot = np.zeros(0, dtype=np.float32)
+        self._frame_count = 0
         self.playing = False
         self.start_time = 0
         self.current_frame_index = 0
-    
+
     def start_playback(self):
         """Start playback with recorded data"""
         self.playing = True
@@ -112,37 +213,59 @@ class GhostPlayback:
         self.playing = False
         self.current_frame_index = 0
     
-    def get_current_ghost_state(self):
-        """Get the current ghost state based on playback time"""
-        if not self.playing or not self.frames:
+    def get_current_ghost_state(self, now=None):
+        """Get the current ghost state based on playback time (now is an
+        optional shared tick reading for this frame)"""
+        if not self.playing or self._frame_count == 0:
             return None
-        
-        current_time = pygame.time.get_ticks()
-        playback_time = current_time - self.start_time
-        
-        # Find the appropriate frame for current time
-        target_frame = None
-        for frame in self.frames[self.current_frame_index:]:
-            if frame.timestamp <= playback_time:
-                target_frame = frame
-                self.current_frame_index = self.frames.index(frame)
-            else:
-                break
-        
-        return target_frame
+
+        if now is None:
+            now = pygame.time.get_ticks()
+        playback_time = now - self.start_time
+
+        # Playback time advances monotonically, so the target is almost
+        # always the cached frame itself; check that with one comparison
+        # before falling back to a binary search over the timestamps
+        idx = self.current_frame_index
+        ts = self._ts
+        n = self._frame_count
+        if not (ts[idx] <= playback_time and (idx + 1 >= n or ts[idx + 1] > playback_time)):
+            idx = int(np.searchsorted(ts[:n], playback_time, side='right')) - 1
+            if idx < 0:
+                return None
+            self.current_frame_index = idx
+
+        # Interpolate between the bracketing samples so playback is smooth
+        # even though recording only samples every few frames
+        x0, y0, r0 = float(self._x[idx]), float(self._y[idx]), float(self._rot[idx])
+        if idx + 1 < n:
+            t0, t1 = int(ts[idx]), int(ts[idx + 1])
+            if t1 > t0:
+                f = (playback_time - t0) / (t1 - t0)
+                x0 += (float(self._x[idx + 1]) - x0) * f
+                y0 += (float(self._y[idx + 1]) - y0) * f
+                # Rotate along the shortest arc (359 -> 1 goes through 0)
+                dr = ((float(self._rot[idx + 1]) - r0 + 180.0) % 360.0) - 180.0
+                r0 = (r0 + dr * f) % 360.0
+
+        return GhostFrame(playback_time, x0, y0, r0)
 
     
     def load_playback_data(self, recording_data):
-        """Load playback data from a list of dictionaries"""
-        self.frames = []
-        for frame_dict in recording_data:
-            frame = GhostFrame(
-                frame_dict['timestamp'],
-                frame_dict['x'],
-                frame_dict['y'],
-                frame_dict['rotation']
-            )
-            self.frames.append(frame)
+        """
+        Load playback data from either packed dict format (version 1
+        float32 or version 2 delta-encoded int16) or the legacy list of
+        per-frame dictionaries still stored for older ghosts.
+        """
+        if isinstance(recording_data, dict):
+            self._ts, self._x, self._y, self._rot = _decode_packed_frames(recording_data)
+        else:
+            self._ts = np.array([f['timestamp'] for f in recording_data], dtype=np.int32)
+            self._x = np.array([f['x'] for f in recording_data], dtype=np.float32)
+            self._y = np.array([f['y'] for f in recording_data], dtype=np.float32)
+            self._rot = np.array([f['rotation'] for f in recording_data], dtype=np.float32)
+        self._frame_count = len(self._ts)
+        self.current_frame_index = 0
     
     def is_playing(self):
         """Check if currently playing back"""
@@ -154,6 +277,7 @@ class Ghost(Entity):
     
     def __init__(self, image_path="spaceship.png"):
         super().__init__(0, 0, 0, image_path)
+        self.is_static = True  # driven by recorded frames, not physics
         self.visible = False
         self.alpha = 128  # 50% transparency
         
@@ -165,18 +289,19 @@ class Ghost(Entity):
         """Create a semi-transparent version of the spaceship image"""
         # Create a copy of the original image with alpha channel
         transparent_image = self.renderer.original_image.copy().convert_alpha()
-        
-        # Apply transparency to the entire image
-        for x in range(transparent_image.get_width()):
-            for y in range(transparent_image.get_height()):
-                pixel = transparent_image.get_at((x, y))
-                if pixel[3] > 0:  # If pixel is not fully transparent
-                    # Set alpha to our desired transparency level
-                    transparent_image.set_at((x, y), (pixel[0], pixel[1], pixel[2], self.alpha))
-        
-        # Update the renderer with the transparent image
+
+        # Scale the alpha channel in one SDL blend fill. RGB stays intact
+        # (multiplied by 255) and each pixel's alpha is multiplied by
+        # self.alpha/255 — for the sprite's binary alpha this lands on the
+        # same result as setting opaque pixels to self.alpha directly.
+        transparent_image.fill((255, 255, 255, self.alpha),
+                               special_flags=pygame.BLEND_RGBA_MULT)
+
+        # Update the renderer with the transparent image and drop any
+        # rotations cached from the opaque original
         self.renderer.original_image = transparent_image
         self.renderer.current_image = transparent_image.copy()
+        self.renderer._rotation_cache = {}
     
     def update_from_ghost_frame(self, ghost_frame):
         """Update ghost position and rotation from a ghost frame"""
@@ -187,11 +312,6 @@ class Ghost(Entity):
         else:
             self.visible = False
     
-    def update(self, delta_time=1.0):
-        """Update the ghost entity (no physics needed)"""
-        # Ghost doesn't need physics updates, it just follows recorded data
-        pass
-    
     def is_visible(self):
         """Check if ghost should be rendered"""
         return self.visible
@@ -1,12 +1,45 @@
 import pygame
 import platform
 
+# Key constants bound once at module scope, so the per-frame input reads
+# index the snapshot directly instead of doing a pygame attribute lookup
+# per key per frame
+_K_UP = pygame.K_UP
+_K_DOWN = pygame.K_DOWN
+_K_LEFT = pygame.K_LEFT
+_K_RIGHT = pygame.K_RIGHT
+_K_RETURN = pygame.K_RETURN
+_K_ESCAPE = pygame.K_ESCAPE
+_K_R = pygame.K_r
+
 class InputManager:
     """Handles input processing for both keyboard and controller with debouncing"""
-    
+
+    # Game input flags returned by process_game_input as one packed int,
+    # avoiding a tuple allocation and unpack in the 60 Hz path
+    THRUST = 1 << 0
+    ROTATE_LEFT = 1 << 1
+    ROTATE_RIGHT = 1 << 2
+    BACK_TO_MENU = 1 << 3
+    RESET_LEVEL = 1 << 4
+
     def __init__(self):
         self.joystick = None
-        
+
+        # Controller discovery runs once, not per frame; hotplug events
+        # (JOYDEVICEADDED/REMOVED) clear this flag to trigger a re-scan
+        self._controller_checked = False
+
+        # Button count probed once at controller init; input polling gates
+        # on it instead of wrapping every get_button in try/except
+        self._num_buttons = 0
+
+        # Per-frame input snapshot filled by poll(); menu and game input
+        # processing read these instead of re-querying SDL
+        self._keys = None
+        self._controller_state = (False,) * 7
+
+
         # Input debouncing timers - preserved from original main.py
         self.last_navigate_time = 0
         self.last_select_time = 0
@@ -17,8 +50,17 @@ class InputManager:
         self.select_delay = 300    # milliseconds between select inputs
         self.reset_delay = 500     # milliseconds between reset inputs
     
+    def notify_device_change(self):
+        """Re-scan controllers on the next input poll (called on hotplug events)"""
+        self._controller_checked = False
+        self.joystick = None
+        self._num_buttons = 0
+
     def setup_controller(self):
-        """Setup PS4 controller if not already initialized (matching original logic)"""
+        """Setup PS4 controller on first call or after a hotplug event"""
+        if self._controller_checked:
+            return self.joystick
+        self._controller_checked = True
         if self.joystick is None and pygame.joystick.get_count() > 0:
             # TODO figure out something more robust to pick the right controller (on mobile especially)
             for i in range(pygame.joystick.get_count()):
@@ -27,6 +69,7 @@ class InputManager:
                     break
             if self.joystick is not None:
                 self.joystick.init()
+                self._num_buttons = self.joystick.get_numbuttons()
                 platform.console.log(f"Controller detected: {self.joystick.get_name()}")
         
         return self.joystick
@@ -42,38 +85,35 @@ class InputManager:
         controller_reset = False    # Reset (Triangle button)
         
         if self.joystick is not None:
+            # Button availability was probed once at init; gate each read on
+            # the cached count instead of a try/except per button per frame
+            num_buttons = self._num_buttons
+
             # PS4 X button for main action (button 0)
             controller_action1 = self.joystick.get_button(0)
-            
+
             # PS4 Circle button for secondary action (button 1) - back to menu
-            try:
-                controller_action2 = self.joystick.get_button(1)
-            except:
-                controller_action2 = False
-            
+            controller_action2 = num_buttons > 1 and self.joystick.get_button(1)
+
             # PS4 Triangle button for reset (button 2)
-            try:
-                controller_reset = self.joystick.get_button(2)
-            except:
-                controller_reset = False
-            
+            controller_reset = num_buttons > 2 and self.joystick.get_button(2)
+
             # Use left analog stick for navigation
             left_stick_x = self.joystick.get_axis(0)  # left/right axis
             left_stick_y = self.joystick.get_axis(1)  # up/down axis
-            
-            # Use D-pad for navigation as well
-            try:
-                dpad_left = self.joystick.get_button(14)
-                dpad_right = self.joystick.get_button(15)
+
+            # Use D-pad for navigation as well (buttons 12-15 where present)
+            if num_buttons > 15:
                 dpad_up = self.joystick.get_button(12)
                 dpad_down = self.joystick.get_button(13)
-            except:
-                # Fallback if D-pad buttons don't exist
+                dpad_left = self.joystick.get_button(14)
+                dpad_right = self.joystick.get_button(15)
+            else:
                 dpad_left = False
                 dpad_right = False
                 dpad_up = False
                 dpad_down = False
-            
+
             # Set controller navigation flags
             controller_left = (left_stick_x < -0.3) or dpad_left
             controller_right = (left_stick_x > 0.3) or dpad_right
@@ -83,46 +123,54 @@ class InputManager:
         return (controller_action1, controller_action2, controller_reset,
                 controller_left, controller_right, controller_up, controller_down)
     
+    def poll(self):
+        """Snapshot keyboard and controller state once per frame"""
+        self.joystick = self.setup_controller()
+        self._keys = pygame.key.get_pressed()
+        self._controller_state = self.get_controller_inputs()
+
     def process_menu_input(self):
         """Process menu input (matching original logic exactly)"""
-        # Setup controller
-        self.joystick = self.setup_controller()
-        
-        # Handle continuous key presses
-        keys = pygame.key.get_pressed()
-        
-        # Get controller inputs
+        # Read this frame's input snapshot (polling lazily if the loop
+        # hasn't called poll() yet this frame)
+        if self._keys is None:
+            self.poll()
+        keys = self._keys
         (controller_action1, controller_action2, controller_reset,
-         controller_left, controller_right, controller_up, controller_down) = self.get_controller_inputs()
-        
+         controller_left, controller_right, controller_up, controller_down) = self._controller_state
+
         # Menu input handling (up/down navigation for vertical layout)
-        navigate_up = keys[pygame.K_UP] or controller_up
-        navigate_down = keys[pygame.K_DOWN] or controller_down
-        select = keys[pygame.K_RETURN] or controller_action1
-        back_to_menu = keys[pygame.K_ESCAPE] or controller_action2
+        navigate_up = keys[_K_UP] or controller_up
+        navigate_down = keys[_K_DOWN] or controller_down
+        select = keys[_K_RETURN] or controller_action1
+        back_to_menu = keys[_K_ESCAPE] or controller_action2
         
         return self.joystick, navigate_up, navigate_down, select, back_to_menu
     
     def process_game_input(self):
-        """Process game input (matching original logic exactly)"""
-        # Setup controller
-        self.joystick = self.setup_controller()
-        
-        # Handle continuous key presses
-        keys = pygame.key.get_pressed()
-        
-        # Get controller inputs
+        """Process game input, returning the packed flag bits"""
+        # Read this frame's input snapshot (polling lazily if the loop
+        # hasn't called poll() yet this frame)
+        if self._keys is None:
+            self.poll()
+        keys = self._keys
         (controller_action1, controller_action2, controller_reset,
-         controller_left, controller_right, controller_up, controller_down) = self.get_controller_inputs()
-        
+         controller_left, controller_right, controller_up, controller_down) = self._controller_state
+
         # Game input handling
-        thrust = keys[pygame.K_UP] or controller_action1
-        rotate_left = keys[pygame.K_LEFT] or controller_left
-        rotate_right = keys[pygame.K_RIGHT] or controller_right
-        back_to_menu = keys[pygame.K_ESCAPE] or controller_action2
-        reset_level = keys[pygame.K_r] or controller_reset  # R key + Triangle button
-        
-        return self.joystick, thrust, rotate_left, rotate_right, back_to_menu, reset_level
+        flags = 0
+        if keys[_K_UP] or controller_action1:
+            flags |= self.THRUST
+        if keys[_K_LEFT] or controller_left:
+            flags |= self.ROTATE_LEFT
+        if keys[_K_RIGHT] or controller_right:
+            flags |= self.ROTATE_RIGHT
+        if keys[_K_ESCAPE] or controller_action2:
+            flags |= self.BACK_TO_MENU
+        if keys[_K_R] or controller_reset:  # R key + Triangle button
+            flags |= self.RESET_LEVEL
+
+        return flags
     
     def check_debounced_navigate(self, navigate_input, current_time):
         """Check if navigation input should be processed (with debouncing)"""
@@ -1,5 +1,14 @@
 import pygame
 import os
+import numpy as np
+
+# Collision class ids used in the packed class map (index _ID_TO_NAME by id)
+_FREE_ID = 0
+_SOLID_ID = 1
+_GOAL_ID = 2
+_HAZARD_ID = 3
+_SPECIAL_ID = 4
+_ID_TO_NAME = ('FREE', 'SOLID', 'GOAL', 'HAZARD', 'SPECIAL')
 
 class Level:
     """
@@ -54,7 +63,25 @@ class Level:
             # Store dimensions
             self.width = self.collision_surface.get_width()
             self.height = self.collision_surface.get_height()
-            
+
+            # Classify every pixel once into a packed uint8 class map. Any
+            # pixel that isn't a known color defaults to solid, matching the
+            # old per-call color-table scan. Point queries become one array
+            # index and the per-class masks are derived views of the map.
+            # pixels2d exposes each pixel as one packed integer, so each
+            # class is a single equality compare against map_rgb(color)
+            # rather than a three-channel reduction.
+            pixels = pygame.surfarray.pixels2d(self.collision_surface)
+            self.class_map = np.full((self.width, self.height), _SOLID_ID, dtype=np.uint8)
+            for class_id, collision_type in ((_FREE_ID, 'FREE'), (_GOAL_ID, 'GOAL'),
+                                             (_HAZARD_ID, 'HAZARD'), (_SPECIAL_ID, 'SPECIAL')):
+                packed = self.collision_surface.map_rgb(self.COLLISION_COLORS[collision_type])
+                self.class_map[pixels == packed] = class_id
+            del pixels  # release the surface lock held by the view
+            self.solid_mask = (self.class_map == _SOLID_ID).astype(np.uint8)
+            self.special_mask = self.class_map == _SPECIAL_ID
+            self.hazard_mask = self.class_map == _HAZARD_ID
+
         except pygame.error as e:
             raise RuntimeError(f"Failed to load level image {self.image_path}: {e}")
     
@@ -72,37 +99,52 @@ class Level:
         # Bounds checking
         if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return 'SOLID'  # Treat out-of-bounds as solid collision
-        
-        # Get pixel color at the specified point
-        try:
-            pixel_color = self.collision_surface.get_at((int(x), int(y)))[:3]  # Get RGB, ignore alpha
-            
-            # Match color to collision type
-            for collision_type, color in self.COLLISION_COLORS.items():
-                if pixel_color == color:
-                    return collision_type
-            
-            # If no exact match, return UNKNOWN (treat as solid for safety)
-            return 'SOLID'
-            
-        except Exception:
-            # If any error occurs, treat as solid collision
-            return 'SOLID'
+
+        # One index into the precomputed class map (unknown colors were
+        # already classified as solid at load time)
+        return _ID_TO_NAME[self.class_map[int(x), int(y)]]
     
     
     def is_solid_collision(self, x, y):
         """
         Quick check if a point has solid collision.
-        
+
+        Backed by the NumPy solid mask: one integer index instead of a
+        surface get_at plus a color-table scan.
+
         Args:
             x (int): X coordinate
             y (int): Y coordinate
-            
+
         Returns:
             bool: True if solid collision, False otherwise
         """
-        collision_type = self.check_collision_at_point(x, y)
-        return collision_type == 'SOLID'
+        xi, yi = int(x), int(y)
+        if xi < 0 or xi >= self.width or yi < 0 or yi >= self.height:
+            return True  # Treat out-of-bounds as solid collision
+        return bool(self.solid_mask[xi, yi])
+
+
+    def sample_mask_rect(self, x, y, width, height):
+        """
+        Check whether any pixel in a rectangle is solid.
+
+        Out-of-bounds rectangles count as solid, matching the point checks.
+
+        Args:
+            x (int): X coordinate of the rectangle's top-left corner
+            y (int): Y coordinate of the rectangle's top-left corner
+            width (int): Rectangle width
+            height (int): Rectangle height
+
+        Returns:
+            bool: True if the rectangle touches any solid pixel
+        """
+        x0, y0 = int(x), int(y)
+        x1, y1 = x0 + int(width), y0 + int(height)
+        if x0 < 0 or y0 < 0 or x1 > self.width or y1 > self.height:
+            return True
+        return bool(self.solid_mask[x0:x1, y0:y1].any())
     
     
     def is_special_collision(self, x, y):
@@ -134,9 +176,8 @@ class Level:
         Returns:
             tuple: (solid_collision, special_collision, hazard_collision) - all bool values
         """
-        # Get spaceship dimensions
-        ship_width = spaceship_surface.get_width()
-        ship_height = spaceship_surface.get_height()
+        # Get spaceship dimensions in one call
+        ship_width, ship_height = spaceship_surface.get_size()
         
         # Check bounds to avoid unnecessary pixel checking
         if (spaceship_x >= self.width or spaceship_y >= self.height or
@@ -153,49 +194,32 @@ class Level:
         start_y = max(0, spaceship_y_int)
         end_y = min(self.height, spaceship_y_int + ship_height)
         
-        # Track collision types found
-        solid_collision = False
-        special_collision = False
-        hazard_collision = False
-        
-        # Check each pixel in the overlapping region
-        for level_x in range(start_x, end_x):
-            for level_y in range(start_y, end_y):
-                # Calculate corresponding spaceship pixel coordinates
-                ship_pixel_x = level_x - spaceship_x_int
-                ship_pixel_y = level_y - spaceship_y_int
-                
-                # Skip if outside spaceship bounds (shouldn't happen but safety check)
-                if (ship_pixel_x < 0 or ship_pixel_x >= ship_width or
-                    ship_pixel_y < 0 or ship_pixel_y >= ship_height):
-                    continue
-                
-                # Get spaceship pixel (with alpha channel)
-                try:
-                    spaceship_pixel = spaceship_surface.get_at((ship_pixel_x, ship_pixel_y))
-                    spaceship_alpha = spaceship_pixel[3] if len(spaceship_pixel) > 3 else 255
-                    
-                    # Only check collision if spaceship pixel is not transparent
-                    if spaceship_alpha > 0:  # Non-transparent pixel
-                        # Check collision type at this level position
-                        collision_type = self.check_collision_at_point(level_x, level_y)
-                        
-                        if collision_type == 'SOLID':
-                            solid_collision = True
-                        elif collision_type == 'SPECIAL':
-                            special_collision = True
-                        elif collision_type == 'HAZARD':
-                            hazard_collision = True
-                        
-                        # Early exit optimization: if we found solid collision, no need to continue
-                        # (since solid collision would stop the game anyway)
-                        if solid_collision:
-                            return True, special_collision, hazard_collision
-                            
-                except (IndexError, pygame.error):
-                    # Skip invalid pixels
-                    continue
-        
+        # Cheap rejection first: if nothing under the ship's bounding box is
+        # classified at all (all FREE), skip locking the ship surface and
+        # the per-mask reductions entirely — the common case in open space
+        if not (self.class_map[start_x:end_x, start_y:end_y] != _FREE_ID).any():
+            return False, False, False
+
+        # Slice the ship's alpha channel over the overlap region and test it
+        # against the precomputed collision masks in a few vectorized any()
+        # reductions instead of a per-pixel Python loop
+        ship_start_x = start_x - spaceship_x_int
+        ship_end_x = end_x - spaceship_x_int
+        ship_start_y = start_y - spaceship_y_int
+        ship_end_y = end_y - spaceship_y_int
+
+        # pixels_alpha locks the ship surface once and gives a zero-copy
+        # view (array_alpha would copy the whole plane every call); the
+        # comparison materializes just the overlap slice, after which the
+        # view is dropped to release the lock
+        ship_alpha = pygame.surfarray.pixels_alpha(spaceship_surface)
+        opaque = ship_alpha[ship_start_x:ship_end_x, ship_start_y:ship_end_y] > 0
+        del ship_alpha
+
+        solid_collision = bool((opaque & (self.solid_mask[start_x:end_x, start_y:end_y] != 0)).any())
+        special_collision = bool((opaque & self.special_mask[start_x:end_x, start_y:end_y]).any())
+        hazard_collision = bool((opaque & self.hazard_mask[start_x:end_x, start_y:end_y]).any())
+
         return solid_collision, special_collision, hazard_collision
 
     def get_visual_surface(self):
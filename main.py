@@ -8,6 +8,11 @@ from game_state_manager import GameStateManager
 SCREEN_WIDTH = 1440
 SCREEN_HEIGHT = 2560
 
+# Fixed physics timestep: gameplay always steps in whole 60 Hz frames and
+# leftover time carries over, so physics results don't drift with frame rate
+DT_FIXED_MS = 1000.0 / 60.0
+MAX_ACCUMULATED_MS = DT_FIXED_MS * 5  # cap catch-up after long stalls
+
 async def main():
     """Main game function - now much cleaner with class-based architecture"""
     
@@ -41,42 +46,62 @@ async def main():
     
     # Game loop
     clock = pygame.time.Clock()
-    delta_time = 1.0  # Initialize delta_time for first frame
-    
+    accumulated_ms = 0.0  # unsimulated time carried between frames
+
     while game_manager.is_running():
         # Handle pygame events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 game_manager.quit()
+            elif event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED):
+                # Controller discovery is event-driven, not per-frame
+                game_manager.input_manager.notify_device_change()
 
         if game_manager.trigger_scoreboard_update:
             await game_manager.initialize_scoreboard()
 
+        # One shared tick reading and one input snapshot for this frame
+        frame_ticks = pygame.time.get_ticks()
+        game_manager.input_manager.poll()
+
         # Handle input and update game state based on current state
         if game_manager.get_current_state().value == "menu":
             # Handle menu input
-            game_manager.handle_menu_input()
-        
+            game_manager.handle_menu_input(frame_ticks)
+            accumulated_ms = 0.0
+
         elif game_manager.get_current_state().value == "playing":
             # Handle game input
-            game_manager.handle_game_input()
-            
-            # Update gameplay logic with delta_time for frame-rate independent physics
-            game_manager.update_gameplay(delta_time)
-            
-            # Check for level completion
-            if game_manager.is_level_completed():
-                # Handle scoreboard update and level completion logic
-                await game_manager.handle_level_completion()
-                
-                # Show completion overlay (preserved from original)
-                game_manager.renderer.render_level_completion_overlay(screen)
-                game_manager.renderer.update_display()
-                
-                # Wait a moment then return to menu (preserved timing)
-                await asyncio.sleep(2)
-                game_manager.switch_to_menu()
-                continue
+            game_manager.handle_game_input(frame_ticks)
+
+            # Step physics in fixed 60 Hz increments, banking any remainder
+            # for the next frame instead of scaling by a variable delta
+            while accumulated_ms >= DT_FIXED_MS:
+                game_manager.update_gameplay(1.0, frame_ticks)
+                accumulated_ms -= DT_FIXED_MS
+
+        elif game_manager.get_current_state().value == "completed":
+            # Handle scoreboard update and level completion logic
+            await game_manager.handle_level_completion()
+
+            # Show completion overlay (preserved from original)
+            game_manager.renderer.render_level_completion_overlay(screen)
+            game_manager.renderer.update_display()
+
+            # Wait a moment then return to menu (preserved timing), keeping
+            # the event queue drained so QUIT still works and the SDL queue
+            # can't overflow and drop input during the splash
+            splash_end = pygame.time.get_ticks() + 2000
+            while game_manager.is_running() and pygame.time.get_ticks() < splash_end:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        game_manager.quit()
+                    elif event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED):
+                        game_manager.input_manager.notify_device_change()
+                await asyncio.sleep(1 / 60)
+            game_manager.switch_to_menu()
+            accumulated_ms = 0.0
+            continue
 
         # Render the current state
         game_manager.render_current_state(screen)
@@ -84,12 +109,23 @@ async def main():
         # Update display
         game_manager.renderer.update_display()
         
-        # Control frame rate and calculate delta_time for frame-rate independent physics
-        # clock.tick(60) returns milliseconds elapsed since last call
-        dt_ms = clock.tick(60)
-        # Normalize to a standard 60 FPS frame (16.67ms)
-        delta_time = dt_ms / 16.67
+        # Yield to the event loop immediately after presenting, while the
+        # browser is still compositing the frame — pending network callbacks
+        # (scoreboard/ghost traffic) run in that window instead of eating
+        # into the next frame's budget
         await asyncio.sleep(0)  # This line is critical; ensure you keep the sleep time at 0
+
+        # Frame pacing: measure the frame with an uncapped tick, then hand
+        # the rest of the 60 Hz budget to the event loop as real idle time
+        # instead of burning it inside SDL_Delay. The elapsed time is banked
+        # for the fixed-step physics loop; the cap stops a long stall (tab
+        # switch, GC pause) from triggering a spiral of catch-up steps.
+        dt_ms = clock.tick()
+        remaining_ms = DT_FIXED_MS - dt_ms
+        if remaining_ms > 1:
+            await asyncio.sleep(remaining_ms / 1000.0)
+            dt_ms += clock.tick()
+        accumulated_ms = min(accumulated_ms + dt_ms, MAX_ACCUMULATED_MS)
     
     # Quit (preserved from original)
     pygame.quit()
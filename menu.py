@@ -1,12 +1,13 @@
 import pygame
 import os
 from enum import Enum
-from level import Level
+from operator import itemgetter
 
 class GameState(Enum):
     """Enum to track current game state"""
     MENU = "menu"
     PLAYING = "playing"
+    COMPLETED = "completed"
 
 class LevelInfo:
     """Data structure to hold level information"""
@@ -16,6 +17,23 @@ class LevelInfo:
         self.thumbnail = None
         self.thumbnail_rect = None
 
+# Composed thumbnails cached across MenuState rebuilds, keyed by
+# (filename, size). The menu is reconstructed whenever the scoreboard
+# refreshes, and the full-resolution PNG decode + scale is by far the
+# slowest part of that rebuild
+_thumbnail_cache = {}
+
+# Default-font instances reused across menu rebuilds, keyed by size;
+# pygame.font.Font(None, size) re-parses the bundled font each call
+_font_cache = {}
+
+def _get_font(size):
+    font = _font_cache.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _font_cache[size] = font
+    return font
+
 class MenuState:
     """Manages the level selection menu functionality"""
     
@@ -38,11 +56,39 @@ class MenuState:
         self.BLUE = (0, 100, 255)
         self.HIGHLIGHT_COLOR = (255, 255, 0)  # Yellow highlight
         
-        # Fonts
-        self.title_font = pygame.font.Font(None, self.MENU_TITLE_SIZE)
-        self.level_font = pygame.font.Font(None, self.LEVEL_NAME_SIZE)
-        
+        # Fonts (shared across rebuilds)
+        self.title_font = _get_font(self.MENU_TITLE_SIZE)
+        self.level_font = _get_font(self.LEVEL_NAME_SIZE)
+
+        # Rendered-text cache keyed by (font, string, color); SDL_ttf
+        # rasterization is the menu's hottest per-frame cost and the same
+        # dozen strings are drawn every frame
+        self._text_cache = {}
+
+        # Everything except the selection highlight is static between
+        # scoreboard changes, so it's composed once onto this layer and
+        # redrawn with a single blit per frame
+        self._static_layer = None
+        self._static_dirty = True
+
+        # Shared thumbnail background template; copying a converted
+        # surface is a straight memcpy, cheaper than allocating and
+        # filling a fresh surface per level
+        self._thumb_bg = pygame.Surface(self.THUMBNAIL_SIZE)
+        self._thumb_bg.fill(self.BLACK)
+        if pygame.display.get_surface() is not None:
+            self._thumb_bg = self._thumb_bg.convert()
+
         self.initialize_levels()
+
+    def _render_text(self, font, text, color):
+        """Render text through the cache, rasterizing each distinct string once"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
     
     def initialize_levels(self):
         """Initialize the available levels"""
@@ -60,6 +106,11 @@ class MenuState:
     
     def generate_thumbnail(self, level_info):
         """Generate a thumbnail for a level"""
+        cached = _thumbnail_cache.get((level_info.filename, self.THUMBNAIL_SIZE))
+        if cached is not None:
+            level_info.thumbnail = cached
+            return
+
         if not os.path.exists(level_info.filename):
             print(f"Warning: Level file {level_info.filename} not found")
             # Create a placeholder thumbnail
@@ -72,9 +123,15 @@ class MenuState:
             return
         
         try:
-            # Load the level image
+            # Load the level image, converting to display format so the
+            # scale below and every menu-frame blit skip per-pixel format
+            # conversion (the menu is only built after set_mode, but guard
+            # anyway so a headless construction doesn't raise)
             level_image = pygame.image.load(level_info.filename)
-            
+            if pygame.display.get_surface() is not None:
+                level_image = level_image.convert()
+
+
             # Scale image while preserving aspect ratio
             original_width, original_height = level_image.get_size()
             target_width, target_height = self.THUMBNAIL_SIZE
@@ -88,24 +145,38 @@ class MenuState:
             new_width = int(original_width * scale)
             new_height = int(original_height * scale)
             
-            # Scale the image preserving aspect ratio
-            scaled_image = pygame.transform.scale(level_image, (new_width, new_height))
-            
-            # Create thumbnail surface and center the scaled image
-            level_info.thumbnail = pygame.Surface(self.THUMBNAIL_SIZE)
-            level_info.thumbnail.fill(self.BLACK)  # Fill background
+            # Scale the image preserving aspect ratio; smoothscale's
+            # bilinear filtering is SIMD-accelerated in pygame-ce and
+            # looks far better than nearest-neighbor at this reduction
+            scaled_image = pygame.transform.smoothscale(level_image, (new_width, new_height))
+
+            # Start from the shared background template
+            level_info.thumbnail = self._thumb_bg.copy()
             
             # Center the scaled image on the thumbnail
             x_offset = (target_width - new_width) // 2
             y_offset = (target_height - new_height) // 2
             level_info.thumbnail.blit(scaled_image, (x_offset, y_offset))
-            
+
+            # Display-format the composed thumbnail once so the per-frame
+            # menu blit is a straight copy
+            if pygame.display.get_surface() is not None:
+                level_info.thumbnail = level_info.thumbnail.convert()
+
+            _thumbnail_cache[(level_info.filename, self.THUMBNAIL_SIZE)] = level_info.thumbnail
+
         except pygame.error as e:
             print(f"Error loading level {level_info.filename}: {e}")
             # Create error placeholder
             level_info.thumbnail = pygame.Surface(self.THUMBNAIL_SIZE)
             level_info.thumbnail.fill((128, 0, 0))  # Dark red for error
     
+    def update_score(self, level_name, user, time):
+        """Update a single scoreboard entry in place (no full menu rebuild)"""
+        level_scores = self.scoreboard.setdefault(level_name, {})
+        level_scores[user] = time
+        self._static_dirty = True
+
     def navigate_up(self):
         """Move selection up (previous level)"""
         if self.selected_level_index > 0:
@@ -124,18 +195,36 @@ class MenuState:
     
     def render(self, screen):
         """Render the menu screen"""
-        # Clear screen with black background
-        screen.fill(self.BLACK)
-        
+        if self._static_dirty or self._static_layer is None:
+            self._compose_static()
+            self._static_dirty = False
+
+        # One blit for the whole static menu, then just the highlight
+        screen.blit(self._static_layer, (0, 0))
+        selected = self.get_selected_level()
+        if selected and selected.thumbnail_rect:
+            highlight_rect = selected.thumbnail_rect.inflate(10, 10)
+            pygame.draw.rect(screen, self.HIGHLIGHT_COLOR, highlight_rect, 5)
+
+    def _compose_static(self):
+        """Compose everything except the selection highlight onto one layer"""
+        layer = pygame.Surface((self.screen_width, self.screen_height))
+        layer.fill(self.BLACK)
+
+        # Collect every blit into one list and flush it through fblits at
+        # the end, dispatching the whole batch in a single C loop instead
+        # of a Python call per surface
+        blit_list = []
+
         # Draw title
-        title_text = self.title_font.render("GRAVITATION", True, self.WHITE)
+        title_text = self._render_text(self.title_font, "GRAVITATION", self.WHITE)
         title_rect = title_text.get_rect(center=(self.screen_width // 2, 100))
-        screen.blit(title_text, title_rect)
-        
+        blit_list.append((title_text, title_rect))
+
         # Draw subtitle
-        subtitle_text = self.level_font.render("Select a Level", True, self.WHITE)
+        subtitle_text = self._render_text(self.level_font, "Select a Level", self.WHITE)
         subtitle_rect = subtitle_text.get_rect(center=(self.screen_width // 2, 180))
-        screen.blit(subtitle_text, subtitle_rect)
+        blit_list.append((subtitle_text, subtitle_rect))
         
         # Calculate starting position for thumbnails (left side, vertically arranged)
         thumbnail_x = 50  # Fixed position on left side
@@ -151,15 +240,9 @@ class MenuState:
             level_info.thumbnail_rect = pygame.Rect(thumbnail_x, thumbnail_y,
                                                    self.THUMBNAIL_SIZE[0], self.THUMBNAIL_SIZE[1])
             
-            # Draw highlight border if selected
-            if i == self.selected_level_index:
-                highlight_rect = level_info.thumbnail_rect.copy()
-                highlight_rect.inflate_ip(10, 10)  # Make border 5px wider on each side
-                pygame.draw.rect(screen, self.HIGHLIGHT_COLOR, highlight_rect, 5)
-            
             # Draw thumbnail
             if level_info.thumbnail:
-                screen.blit(level_info.thumbnail, level_info.thumbnail_rect)
+                blit_list.append((level_info.thumbnail, level_info.thumbnail_rect))
             
             # Draw scoreboard information to the right of thumbnail
             scoreboard_y = thumbnail_y + 20
@@ -167,26 +250,26 @@ class MenuState:
                 level_scores = self.scoreboard[level_info.name]
                 if level_scores:
                     # Sort scores by time (assuming time format is comparable as string)
-                    sorted_scores = sorted(level_scores.items(), key=lambda x: x[1])
+                    sorted_scores = sorted(level_scores.items(), key=itemgetter(1))
                     
                     # Display individual scores
                     current_y = scoreboard_y
                     for idx, (player, time) in enumerate(sorted_scores[:3]):  # Show top 3
                         score_text = f"{idx + 1}. {player}: {time}"
-                        score_surface = self.level_font.render(score_text, True, self.WHITE)
+                        score_surface = self._render_text(self.level_font, score_text, self.WHITE)
                         score_rect = score_surface.get_rect(left=(thumbnail_x + self.THUMBNAIL_SIZE[0] + 40), top=current_y)
-                        screen.blit(score_surface, score_rect)
+                        blit_list.append((score_surface, score_rect))
                         current_y += 25
                 else:
                     # No scores yet
-                    no_scores_text = self.level_font.render("No scores yet", True, self.BLUE)
+                    no_scores_text = self._render_text(self.level_font, "No scores yet", self.BLUE)
                     no_scores_rect = no_scores_text.get_rect(left=(thumbnail_x + self.THUMBNAIL_SIZE[0] + 20), top=scoreboard_y)
-                    screen.blit(no_scores_text, no_scores_rect)
+                    blit_list.append((no_scores_text, no_scores_rect))
             else:
                 # Level not in scoreboard
-                no_data_text = self.level_font.render("No score data", True, self.BLUE)
+                no_data_text = self._render_text(self.level_font, "No score data", self.BLUE)
                 no_data_rect = no_data_text.get_rect(left=(thumbnail_x + self.THUMBNAIL_SIZE[0] + 20), top=scoreboard_y)
-                screen.blit(no_data_text, no_data_rect)
+                blit_list.append((no_data_text, no_data_rect))
         
         # Draw instructions on right side of screen
         instructions = [
@@ -197,7 +280,14 @@ class MenuState:
         instruction_x = self.screen_width // 2 + 100
         instruction_y = start_y
         for instruction in instructions:
-            instruction_text = self.level_font.render(instruction, True, self.WHITE)
+            instruction_text = self._render_text(self.level_font, instruction, self.WHITE)
             instruction_rect = instruction_text.get_rect(left=instruction_x, top=instruction_y)
-            screen.blit(instruction_text, instruction_rect)
-            instruction_y += 50
\ No newline at end of file
+            blit_list.append((instruction_text, instruction_rect))
+            instruction_y += 50
+
+        # Flush the whole layer's blits in one call
+        layer.fblits(blit_list)
+
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        self._static_layer = layer
\ No newline at end of file
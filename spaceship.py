@@ -1,7 +1,39 @@
 import pygame
 import math
+import numpy as np
 from entity import Entity
 
+def _perimeter_offsets(sample_dist, sample_stride):
+    """Precompute the (dx, dy) perimeter sample offsets for normal estimation"""
+    offsets_x = []
+    offsets_y = []
+    for dx in range(-sample_dist, sample_dist + 1, sample_stride):
+        for dy in range(-sample_dist, sample_dist + 1, sample_stride):
+            # Only keep pixels on the perimeter (at least one coordinate at ±sample_dist)
+            if abs(dx) != sample_dist and abs(dy) != sample_dist:
+                continue
+            offsets_x.append(dx)
+            offsets_y.append(dy)
+    return np.array(offsets_x, dtype=np.int64), np.array(offsets_y, dtype=np.int64)
+
+def _circle_offsets(max_distance):
+    """Precompute the expanding-circle (dx, dy) search offsets, nearest first"""
+    offsets = []
+    for radius in range(1, max_distance + 1, 2):
+        for angle in (0, 45, 90, 135, 180, 225, 270, 315):
+            angle_rad = math.radians(angle)
+            offsets.append((radius * math.cos(angle_rad), radius * math.sin(angle_rad)))
+    return tuple(offsets)
+
+def _thrust_lut(power):
+    """Precompute the (thrust_x, thrust_y) vector for every integer degree"""
+    # negative cos for y because pygame y increases down, but we want up to
+    # be negative; x uses sin so 0 degrees points straight up
+    return tuple(
+        (power * math.sin(math.radians(d)), -power * math.cos(math.radians(d)))
+        for d in range(360)
+    )
+
 class Spaceship(Entity):
     """Spaceship entity with thrust and rotation capabilities"""
     
@@ -16,6 +48,19 @@ class Spaceship(Entity):
     COLLISION_NORMAL_SAMPLE_DISTANCE = 40  # Pixels to sample around collision point for normal calculation
     COLLISION_NORMAL_SAMPLE_STRIDE = 5  # Sample every Nth pixel on perimeter (higher = faster but less accurate)
     COLLISION_DAMPING = 0.7  # Energy loss on collision (0.0 = no bounce, 1.0 = perfect bounce)
+
+    # Precomputed perimeter sample offsets for surface-normal calculation
+    _NORMAL_OFFSETS_X, _NORMAL_OFFSETS_Y = _perimeter_offsets(
+        COLLISION_NORMAL_SAMPLE_DISTANCE, COLLISION_NORMAL_SAMPLE_STRIDE
+    )
+
+    # Precomputed thrust vector per integer degree of rotation
+    _THRUST_LUT = _thrust_lut(THRUST_POWER)
+
+    # Search radius for collision-free repositioning, and the precomputed
+    # candidate offsets for the expanding-circle fallback
+    SEARCH_MAX_DISTANCE = 25
+    _CIRCLE_OFFSETS = _circle_offsets(SEARCH_MAX_DISTANCE)
     
     # Starting position constants - preserved from original main.py
     START_X_OFFSET = 1300  # spaceship_x = 1300 - spaceship_rect.width // 2
@@ -27,7 +72,19 @@ class Spaceship(Entity):
         # Set velocity limits
         self.physics.max_velocity = self.MAX_VELOCITY
         self.physics.min_velocity = self.MIN_VELOCITY
-        
+
+        # Rotation only moves in ROTATION_SPEED steps, so the full set of
+        # reachable rotated sprites is small enough to build up front
+        self.renderer.prewarm_rotations(self.ROTATION_SPEED)
+
+        # Cached (screen_w, screen_h, x_max, y_max) for the boundary tests
+        self._boundary_limits = None
+
+        # Bound physics methods for the per-frame gravity/thrust calls;
+        # physics is never reassigned after construction
+        self._add_velocity = self.physics.add_velocity
+        self._apply_gravity = self.physics.apply_gravity
+
         # Initialize to starting position
         self.reset_to_start()
     
@@ -35,7 +92,7 @@ class Spaceship(Entity):
         """Reset spaceship to starting position and state"""
         # Calculate starting position based on image size (matching original logic)
         if self.renderer.original_image:
-            start_x = self.START_X_OFFSET - self.renderer.original_image.get_width() // 2
+            start_x = self.START_X_OFFSET - self.renderer.get_half_size()[0]
         else:
             start_x = self.START_X_OFFSET
         
@@ -46,31 +103,24 @@ class Spaceship(Entity):
     def apply_thrust(self, thrust_active):
         """Apply thrust in the direction the spaceship is facing"""
         if thrust_active:
-            # Convert rotation to radians for math functions (matching original)
-            angle_rad = math.radians(self.transform.rotation)
-            
-            # Calculate thrust components (matching original logic exactly)
-            # negative sin for x because pygame x increases right
-            # negative cos for y because pygame y increases down, but we want up to be negative
-            thrust_x = self.THRUST_POWER * math.sin(angle_rad)
-            thrust_y = -self.THRUST_POWER * math.cos(angle_rad)
-            
-            # Add thrust to velocity
-            self.physics.add_velocity(thrust_x, thrust_y)
+            # Rotation is always an integer number of degrees, so the full
+            # thrust vector comes straight from the lookup table
+            thrust_x, thrust_y = self._THRUST_LUT[int(self.transform.rotation) % 360]
+            self._add_velocity(thrust_x, thrust_y)
     
     def apply_rotation(self, rotate_left, rotate_right, level=None):
         """Apply rotation based on input with collision-free positioning"""
+        # Fold both inputs into one net delta: holding both keys nets out
+        # to no rotation, and at most one rotation update runs per frame
+        delta = ((self.ROTATION_SPEED if rotate_right else 0)
+                 - (self.ROTATION_SPEED if rotate_left else 0))
         rotation_applied = False
-        
-        if rotate_left:
-            self.transform.rotate(-self.ROTATION_SPEED)
-            self.renderer.update_rotation(self.transform.rotation)
-            rotation_applied = True
-        elif rotate_right:
-            self.transform.rotate(self.ROTATION_SPEED)
+
+        if delta:
+            self.transform.rotate(delta)
             self.renderer.update_rotation(self.transform.rotation)
             rotation_applied = True
-        
+
         # If rotation was applied and we have a level, check for collision
         if rotation_applied and level is not None:
             if self.check_collision_with_level(level):
@@ -84,7 +134,7 @@ class Spaceship(Entity):
     
     def apply_gravity(self):
         """Apply constant gravity (matching original)"""
-        self.physics.apply_gravity(self.GRAVITY)
+        self._apply_gravity(self.GRAVITY)
     
     def calculate_surface_normal(self, level, collision_x, collision_y):
         """
@@ -100,22 +150,20 @@ class Spaceship(Entity):
         Returns:
             tuple: (normal_x, normal_y) - normalized perpendicular vector to surface
         """
-        sample_dist = self.COLLISION_NORMAL_SAMPLE_DISTANCE
-        sample_stride = self.COLLISION_NORMAL_SAMPLE_STRIDE
-        gradient_x = 0
-        gradient_y = 0
-        
-        # Sample pixels on the perimeter of the box with a stride for efficiency
-        for dx in range(-sample_dist, sample_dist + 1, sample_stride):
-            for dy in range(-sample_dist, sample_dist + 1, sample_stride):
-                # Only check pixels on the perimeter (at least one coordinate at ±sample_dist)
-                if abs(dx) != sample_dist and abs(dy) != sample_dist:
-                    continue
-                
-                if level.is_solid_collision(collision_x + dx, collision_y + dy):
-                    gradient_x += dx
-                    gradient_y += dy
-        
+        # Sample the whole perimeter in one vectorized pass over the level's
+        # solid mask instead of one is_solid_collision call per pixel
+        sample_x = self._NORMAL_OFFSETS_X + int(collision_x)
+        sample_y = self._NORMAL_OFFSETS_Y + int(collision_y)
+
+        # Out-of-bounds samples count as solid (matching is_solid_collision)
+        inside = ((sample_x >= 0) & (sample_x < level.width) &
+                  (sample_y >= 0) & (sample_y < level.height))
+        solid = ~inside
+        solid[inside] = level.solid_mask[sample_x[inside], sample_y[inside]] != 0
+
+        gradient_x = int(self._NORMAL_OFFSETS_X[solid].sum())
+        gradient_y = int(self._NORMAL_OFFSETS_Y[solid].sum())
+
         # The gradient points toward solid pixels (into the surface)
         # The normal should point away from solid (out of surface)
         # So normal = -gradient (normalized)
@@ -187,42 +235,46 @@ class Spaceship(Entity):
         """Get information needed for collision detection"""
         if not self.renderer.current_image or not self.renderer.original_image:
             return None, 0, 0
-        
-        # Calculate collision position (matching original logic)
-        collision_x = (self.transform.x + self.renderer.original_image.get_width() // 2 - 
-                      self.renderer.current_image.get_width() // 2)
-        collision_y = (self.transform.y + self.renderer.original_image.get_height() // 2 - 
-                      self.renderer.current_image.get_height() // 2)
-        
-        return self.renderer.current_image, collision_x, collision_y
+
+        # The per-angle offset to the rotated image's top-left is cached by
+        # the renderer alongside the rotated surface itself
+        offset_x, offset_y = self.renderer.current_offset
+        return (self.renderer.current_image,
+                self.transform.x + offset_x,
+                self.transform.y + offset_y)
     
+    def _get_boundary_limits(self, screen_width, screen_height):
+        """Get the (x_max, y_max) position limits for the given screen size.
+
+        Folds the screen-minus-sprite subtraction into constants cached on
+        first use so the per-frame boundary tests are pure comparisons.
+        """
+        limits = self._boundary_limits
+        if limits is None or limits[0] != screen_width or limits[1] != screen_height:
+            ship_w, ship_h = self.renderer.get_original_size()
+            limits = (screen_width, screen_height,
+                      screen_width - ship_w, screen_height - ship_h)
+            self._boundary_limits = limits
+        return limits[2], limits[3]
+
     def is_within_screen_bounds(self, screen_width, screen_height):
         """Check if spaceship is within screen boundaries"""
         if not self.renderer.original_image:
             return True
-        
-        # Check screen boundaries (matching original logic)
-        return not (self.transform.x < 0 or
-                   self.transform.x + self.renderer.original_image.get_width() > screen_width or
-                   self.transform.y < 0 or
-                   self.transform.y + self.renderer.original_image.get_height() > screen_height)
-    
+
+        x_max, y_max = self._get_boundary_limits(screen_width, screen_height)
+        return not (self.transform.x < 0 or self.transform.x > x_max or
+                    self.transform.y < 0 or self.transform.y > y_max)
+
     def get_boundary_collision_type(self, screen_width, screen_height):
         """Determine which boundary was hit for bounce direction"""
         if not self.renderer.original_image:
             return False, False
-        
-        bounce_x = False
-        bounce_y = False
-        
-        # Check which screen boundary was hit (matching original logic)
-        if (self.transform.x < 0 or 
-            self.transform.x + self.renderer.original_image.get_width() > screen_width):
-            bounce_x = True
-        if (self.transform.y < 0 or 
-            self.transform.y + self.renderer.original_image.get_height() > screen_height):
-            bounce_y = True
-        
+
+        x_max, y_max = self._get_boundary_limits(screen_width, screen_height)
+        bounce_x = self.transform.x < 0 or self.transform.x > x_max
+        bounce_y = self.transform.y < 0 or self.transform.y > y_max
+
         return bounce_x, bounce_y
     
     def update(self, delta_time=1.0):
@@ -253,23 +305,26 @@ class Spaceship(Entity):
     
     def check_collision_after_rotation(self, level, rotation_delta):
         """Check if spaceship would collide after applying rotation delta"""
+        # Both update_rotation calls below hit the renderer's per-degree
+        # rotation cache (prewarmed for every reachable angle), so the
+        # apply and restore steps are dict lookups, not pixel rotations
         # Store current state
         original_rotation = self.transform.rotation
-        
+
         # Temporarily apply rotation
         self.transform.rotate(rotation_delta)
         self.renderer.update_rotation(self.transform.rotation)
-        
+
         # Check collision
         collision = self.check_collision_with_level(level)
-        
+
         # Restore original state
         self.transform.set_rotation(original_rotation)
         self.renderer.update_rotation(self.transform.rotation)
-        
+
         return collision
     
-    def find_collision_free_position(self, level, max_distance=25):
+    def find_collision_free_position(self, level, max_distance=SEARCH_MAX_DISTANCE):
         """
         Find a nearby collision-free position, prioritizing velocity direction.
         
@@ -280,55 +335,56 @@ class Spaceship(Entity):
         Returns:
             tuple: (x, y) of safe position, or None if none found
         """
-        # Get current velocity direction for prioritized search
+        # Get current velocity direction for prioritized search; compare
+        # squared magnitude so the slow/stationary reject skips the sqrt
         velocity_x, velocity_y = self.get_velocity()
-        velocity_magnitude = math.sqrt(velocity_x**2 + velocity_y**2)
-        
+        velocity_sq = velocity_x * velocity_x + velocity_y * velocity_y
+
         # If we have velocity, use it as primary search direction
-        if velocity_magnitude > 0.1:  # Minimum velocity threshold
-            # Normalize velocity vector
-            norm_vel_x = velocity_x / velocity_magnitude
-            norm_vel_y = velocity_y / velocity_magnitude
-            
-            # Try positions along velocity direction first
+        if velocity_sq > 0.01:  # Minimum velocity threshold (0.1 squared)
+            # Normalize velocity vector (multiply by the inverse magnitude
+            # rather than dividing twice)
+            inv_magnitude = 1.0 / math.sqrt(velocity_sq)
+            norm_vel_x = velocity_x * inv_magnitude
+            norm_vel_y = velocity_y * inv_magnitude
+
+            # Try positions along velocity direction first. The candidate
+            # moves go straight through the transform: collision testing
+            # only reads the transform plus the cached rotation offset, so
+            # the renderer rect updates done by set_position are skipped
+            # until the caller commits a final position.
+            transform = self.transform
+            origin_x, origin_y = transform.x, transform.y
             for distance in range(1, max_distance + 1, 2):  # Step by 2 pixels
-                test_x = self.transform.x + norm_vel_x * distance
-                test_y = self.transform.y + norm_vel_y * distance
-                
-                # Test this position
-                if self._test_position_safe(level, test_x, test_y):
+                test_x = origin_x + norm_vel_x * distance
+                test_y = origin_y + norm_vel_y * distance
+
+                transform.set_position(test_x, test_y)
+                if not self.check_collision_with_level(level):
+                    transform.set_position(origin_x, origin_y)
                     return (test_x, test_y)
-        
+            transform.set_position(origin_x, origin_y)
+
         # If velocity direction doesn't work, try expanding circle search
         return self._expanding_circle_search(level, max_distance)
-    
-    def _test_position_safe(self, level, test_x, test_y):
-        """Test if a position is collision-free"""
-        # Store current position
-        original_x, original_y = self.transform.x, self.transform.y
-        
-        # Temporarily move to test position
-        self.set_position(test_x, test_y)
-        
-        # Check collision
-        collision = self.check_collision_with_level(level)
-        
-        # Restore original position
-        self.set_position(original_x, original_y)
-        
-        return not collision
-    
+
     def _expanding_circle_search(self, level, max_distance):
         """Search for safe position in expanding circle pattern"""
-        # Try positions in expanding circles
-        for radius in range(1, max_distance + 1, 2):  # Step by 2 pixels
-            # Try 8 directions around current position
-            for angle in [0, 45, 90, 135, 180, 225, 270, 315]:
-                angle_rad = math.radians(angle)
-                test_x = self.transform.x + radius * math.cos(angle_rad)
-                test_y = self.transform.y + radius * math.sin(angle_rad)
-                
-                if self._test_position_safe(level, test_x, test_y):
-                    return (test_x, test_y)
-        
+        # Walk the precomputed nearest-first offset table instead of doing
+        # trig per candidate (rebuilt only for a non-default search radius)
+        offsets = (self._CIRCLE_OFFSETS if max_distance == self.SEARCH_MAX_DISTANCE
+                   else _circle_offsets(max_distance))
+        transform = self.transform
+        origin_x, origin_y = transform.x, transform.y
+        for offset_x, offset_y in offsets:
+            test_x = origin_x + offset_x
+            test_y = origin_y + offset_y
+
+            # Same transform-only mutation as the velocity-direction loop
+            transform.set_position(test_x, test_y)
+            if not self.check_collision_with_level(level):
+                transform.set_position(origin_x, origin_y)
+                return (test_x, test_y)
+        transform.set_position(origin_x, origin_y)
+
         return None  # No safe position found
\ No newline at end of file
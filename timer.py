@@ -1,5 +1,9 @@
 import pygame
 
+# Two-digit zero-padded strings for the common mm/ss range, so the hot
+# formatting path indexes a table instead of doing f-string padding work
+_PAD2 = tuple(f"{i:02d}" for i in range(60))
+
 class GameTimer:
     """Manages game timing functionality"""
     
@@ -7,21 +11,35 @@ class GameTimer:
         self.start_time = 0
         self.current_time = 0
         self.is_running = False
+        self._last_tick = -1  # last tick reading seen by update()
     
     def start(self):
         """Start the timer"""
         self.start_time = pygame.time.get_ticks()
         self.current_time = 0
         self.is_running = True
+        self._last_tick = -1
     
     def stop(self):
         """Stop the timer"""
         self.is_running = False
     
-    def update(self):
-        """Update the timer if it's running"""
+    def update(self, now=None):
+        """Update the timer if it's running.
+
+        Args:
+            now: Optional shared tick reading for this frame; falls back to
+                pygame.time.get_ticks() when not provided.
+        """
         if self.is_running:
-            self.current_time = pygame.time.get_ticks() - self.start_time
+            if now is None:
+                now = pygame.time.get_ticks()
+            # Skip the update when the tick counter hasn't advanced since
+            # the last call (common when vsync lands on the same boundary)
+            if now == self._last_tick:
+                return
+            self._last_tick = now
+            self.current_time = now - self.start_time
     
     def get_current_time_ms(self):
         """Get the current time in milliseconds"""
@@ -36,19 +54,43 @@ class GameTimer:
         """
         return self.format_timer(self.current_time)
     
+    @staticmethod
+    def parse_timer(time_text):
+        """
+        Convert an MM:SS.ms string back to integer milliseconds.
+
+        Args:
+            time_text: Formatted time string in MM:SS.ms format
+
+        Returns:
+            int: Time in milliseconds
+        """
+        minutes, rest = time_text.split(':')
+        seconds, ms = rest.split('.')
+        return (int(minutes) * 60 + int(seconds)) * 1000 + int(ms)
+
+    # Last (milliseconds, text) pair formatted, shared across callers so
+    # repeat frames and the completion path reuse one formatted string
+    _format_cache = [None, ""]
+
     @staticmethod
     def format_timer(milliseconds):
         """
         Convert milliseconds to MM:SS.ms format (preserved from original main.py).
-        
+
         Args:
             milliseconds: Time in milliseconds
-            
+
         Returns:
             str: Formatted time string in MM:SS.ms format
         """
-        total_seconds = milliseconds // 1000
-        minutes = total_seconds // 60
-        seconds = total_seconds % 60
-        ms = milliseconds % 1000
-        return f"{minutes:02d}:{seconds:02d}.{ms:03d}"
\ No newline at end of file
+        cache = GameTimer._format_cache
+        if milliseconds == cache[0]:
+            return cache[1]
+        total_seconds, ms = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(total_seconds, 60)
+        mm = _PAD2[minutes] if minutes < 60 else f"{minutes:02d}"
+        text = f"{mm}:{_PAD2[seconds]}.{ms:03d}"
+        cache[0] = milliseconds
+        cache[1] = text
+        return text
\ No newline at end of file